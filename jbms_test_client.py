@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the deployed-API test scripts
+
+test_api.py and test_api_comprehensive.py both use SESSION, so scripts run in one
+process (or under a wrapping runner) reuse the same warm keep-alive connections.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_SIZE = 20
+# Error bodies are printed only up to this many bytes; Render 5xx pages can be tens of KB of HTML
+ERROR_BODY_LIMIT = 512
+
+def error_body(response: requests.Response) -> str:
+    """First ERROR_BODY_LIMIT bytes of an error body, decoded leniently"""
+    return response.content[:ERROR_BODY_LIMIT].decode("utf-8", "replace")
+
+def make_session() -> requests.Session:
+    """Build a session with a pooled adapter that retries transient gateway errors"""
+    session = requests.Session()
+    # POSTs are not in Retry's default allowed_methods, so a create is never sent twice
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Process-wide and shared by every tester that imports it. After a login, test_api.py and
+# test_api_comprehensive.py write their admin Authorization header onto SESSION.headers, so
+# every later request on it is authenticated. Probes that must go out without credentials
+# (401/403 checks) need their own make_session(), or an explicit headers={"Authorization": None}.
+# The Retry policy is shared too: GET/PUT/DELETE on 502/503/504 are re-sent up to 3 times.
+SESSION = make_session()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Login-token cache shared by the API test scripts
+
+functional_tester_base.py and test_api_comprehensive.py keep the admin JWT between runs,
+so a rerun within the token's lifetime skips the login round-trip.
+"""
+
+import base64
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+def jwt_exp(token: str) -> float:
+    """Read the exp claim from a JWT payload without verifying the signature"""
+    try:
+        segment = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+        return float(claims.get("exp", 0))
+    except (IndexError, ValueError, TypeError):
+        return 0.0
+
+def load_token(path: Path, key: str) -> Optional[str]:
+    """Return the token cached at path for key if it is still valid for at least 30s"""
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if cached.get("key") != key or cached.get("exp", 0) <= time.time() + 30:
+        return None
+    return cached.get("access_token")
+
+def save_token(path: Path, key: str, token: str):
+    """Persist the token with its JWT expiry so the next run can skip the login"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A live admin bearer token: owner-only, including a file left 0644 by an older run
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.chmod(path, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps({"key": key, "access_token": token, "exp": jwt_exp(token)}))
+    except OSError:
+        pass
+
+def drop_token(path: Path):
+    """Forget a cached token the server rejected"""
+    try:
+        path.unlink()
+    except OSError:
+        pass
@@ -5,26 +5,53 @@ Tests all APIs based on current database schema and functional requirements
 """
 
 import os
+import sys
 import json
 import time
 import uuid
 import requests
 import urllib3
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json for the report file
+    orjson = None
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 BASE_URL = "https://jbms1.onrender.com"
 
+# (requirement ids, feature label, test module) used for the coverage summary
+REQUIREMENTS_MAP = [
+    ("REQ-001/002", "Customer Management", "CUSTOMERS"),
+    ("REQ-003-009", "Order Management", "ORDERS"),
+    ("REQ-010/011", "Material In", "MATERIALS"),
+    ("REQ-015-018", "Delivery Challans", "CHALLANS"),
+    ("REQ-021-024", "GST Invoices", "INVOICES"),
+    ("REQ-025-028", "Payment Recording", "PAYMENTS"),
+    ("REQ-029-031", "Returns Management", "RETURNS"),
+    ("REQ-032-035", "Inventory Management", "INVENTORY"),
+    ("REQ-036", "Expense Recording", "EXPENSES"),
+    ("REQ-037-045", "Reporting", "REPORTS"),
+]
+
+def body_preview(response, limit: int = 100) -> str:
+    """Decode only the first `limit` bytes of a response body for error details"""
+    return response.content[:limit].decode("utf-8", "replace")
+
 class ComprehensiveAPITester:
     """Complete API Test Suite for all endpoints based on DB schema and functional requirements"""
     
     def __init__(self):
         self.base_url = BASE_URL
+        self.session = requests.Session()
         self.admin_token = None
+        self._known_paths = None  # set of registered API paths, None when /openapi.json is off
         self.test_results = []
         self.test_data = {
             'customers': [],
@@ -64,10 +91,10 @@ class ComprehensiveAPITester:
         print("=" * 60)
         
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        login_data = "username=admin&password = os.getenv("TEST_PASSWORD", "change-me")
+        login_data = {"username": "admin", "password": os.getenv("TEST_PASSWORD", "change-me")}
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/auth/login",
                 data=login_data,
                 headers=headers,
@@ -82,6 +109,7 @@ class ComprehensiveAPITester:
                     "AUTH", "Admin Login", "/api/auth/login", "POST",
                     response.status_code, True, "Login successful"
                 )
+                self.load_known_paths()
                 return True
             else:
                 self.log_test_result(
@@ -97,6 +125,41 @@ class ComprehensiveAPITester:
             )
             return False
     
+    def load_known_paths(self):
+        """Cache the registered API paths from /openapi.json (only served in debug mode)"""
+        try:
+            response = self.session.get(
+                f"{self.base_url}/openapi.json",
+                timeout=10,
+                verify=False
+            )
+            if response.status_code == 200:
+                self._known_paths = set(response.json().get("paths", {}))
+        except Exception:
+            self._known_paths = None
+    
+    def is_registered(self, path: str) -> bool:
+        """Check whether a route prefix is registered, from /openapi.json or by probing the route
+
+        Router roots are declared as "/" (e.g. /api/returns/), so the path matches with or
+        without its trailing slash, or as the prefix of any registered sub-route. Without
+        DEBUG the server has no manifest, so an OPTIONS request asks the route itself:
+        only an unknown path answers 404 (a known one gets 405, or a 307 slash redirect).
+        """
+        if self._known_paths is None:
+            try:
+                response = self.session.options(
+                    f"{self.base_url}{path}",
+                    timeout=10,
+                    verify=False,
+                    allow_redirects=False
+                )
+            except Exception:
+                return True  # let the real requests report the error
+            return response.status_code != 404
+        prefix = path.rstrip("/")
+        return any(known == prefix or known.startswith(prefix + "/") for known in self._known_paths)
+    
     def get_auth_headers(self):
         """Get authorization headers"""
         return {"Authorization": f"Bearer {self.admin_token}"}
@@ -118,7 +181,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/customers",
                 json=customer_data,
                 headers=headers,
@@ -136,7 +199,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "CUSTOMERS", "Create Customer", "/api/customers", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -147,7 +210,7 @@ class ComprehensiveAPITester:
         
         # 2. List Customers
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/customers",
                 headers=headers,
                 timeout=30,
@@ -159,7 +222,7 @@ class ComprehensiveAPITester:
                 customers = response.json()
                 details = f"Retrieved {len(customers) if isinstance(customers, list) else 'unknown'} customers"
             else:
-                details = f"Failed: {response.text[:100]}"
+                details = f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "CUSTOMERS", "List Customers", "/api/customers", "GET",
@@ -174,7 +237,7 @@ class ComprehensiveAPITester:
         
         # 3. Customer Search
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/customers/search?q=Test",
                 headers=headers,
                 timeout=30,
@@ -182,7 +245,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Search executed" if success else f"Failed: {response.text[:100]}"
+            details = f"Search executed" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "CUSTOMERS", "Search Customers", "/api/customers/search", "GET",
@@ -230,7 +293,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/orders",
                 json=order_data,
                 headers=headers,
@@ -248,7 +311,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "ORDERS", "Create Order", "/api/orders", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -259,7 +322,7 @@ class ComprehensiveAPITester:
         
         # 2. List Orders
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/orders",
                 headers=headers,
                 timeout=30,
@@ -271,7 +334,7 @@ class ComprehensiveAPITester:
                 orders = response.json()
                 details = f"Retrieved {len(orders) if isinstance(orders, list) else 'unknown'} orders"
             else:
-                details = f"Failed: {response.text[:100]}"
+                details = f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "ORDERS", "List Orders", "/api/orders", "GET",
@@ -290,7 +353,7 @@ class ComprehensiveAPITester:
             update_data = {"status": "in_progress"}
             
             try:
-                response = requests.put(
+                response = self.session.put(
                     f"{self.base_url}/api/orders/{order_id}",
                     json=update_data,
                     headers=headers,
@@ -299,7 +362,7 @@ class ComprehensiveAPITester:
                 )
                 
                 success = response.status_code == 200
-                details = f"Status updated" if success else f"Failed: {response.text[:100]}"
+                details = f"Status updated" if success else f"Failed: {body_preview(response)}"
                     
                 self.log_test_result(
                     "ORDERS", "Update Order Status", f"/api/orders/{order_id}", "PUT",
@@ -337,7 +400,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/materials/in",
                 json=material_in_data,
                 headers=headers,
@@ -355,7 +418,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "MATERIALS", "Record Material In", "/api/materials/in", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -366,7 +429,7 @@ class ComprehensiveAPITester:
         
         # 2. List Material In
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/materials/in",
                 headers=headers,
                 timeout=30,
@@ -374,7 +437,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Retrieved material in records" if success else f"Failed: {response.text[:100]}"
+            details = f"Retrieved material in records" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "MATERIALS", "List Material In", "/api/materials/in", "GET",
@@ -408,7 +471,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/challans",
                 json=challan_data,
                 headers=headers,
@@ -426,7 +489,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "CHALLANS", "Create Challan", "/api/challans", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -437,7 +500,7 @@ class ComprehensiveAPITester:
         
         # 2. List Challans
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/challans",
                 headers=headers,
                 timeout=30,
@@ -445,7 +508,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Retrieved challans" if success else f"Failed: {response.text[:100]}"
+            details = f"Retrieved challans" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "CHALLANS", "List Challans", "/api/challans", "GET",
@@ -481,7 +544,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/invoices",
                 json=invoice_data,
                 headers=headers,
@@ -499,7 +562,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "INVOICES", "Create Invoice", "/api/invoices", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -510,7 +573,7 @@ class ComprehensiveAPITester:
         
         # 2. List Invoices
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/invoices",
                 headers=headers,
                 timeout=30,
@@ -518,7 +581,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Retrieved invoices" if success else f"Failed: {response.text[:100]}"
+            details = f"Retrieved invoices" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "INVOICES", "List Invoices", "/api/invoices", "GET",
@@ -554,7 +617,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/payments",
                 json=payment_data,
                 headers=headers,
@@ -572,7 +635,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "PAYMENTS", "Record Payment", "/api/payments", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -583,7 +646,7 @@ class ComprehensiveAPITester:
         
         # 2. List Payments
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/payments",
                 headers=headers,
                 timeout=30,
@@ -591,7 +654,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Retrieved payments" if success else f"Failed: {response.text[:100]}"
+            details = f"Retrieved payments" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "PAYMENTS", "List Payments", "/api/payments", "GET",
@@ -624,7 +687,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/inventory",
                 json=inventory_data,
                 headers=headers,
@@ -642,7 +705,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "INVENTORY", "Create Inventory Item", "/api/inventory", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -653,7 +716,7 @@ class ComprehensiveAPITester:
         
         # 2. List Inventory
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/inventory",
                 headers=headers,
                 timeout=30,
@@ -661,7 +724,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Retrieved inventory items" if success else f"Failed: {response.text[:100]}"
+            details = f"Retrieved inventory items" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "INVENTORY", "List Inventory", "/api/inventory", "GET",
@@ -685,7 +748,7 @@ class ComprehensiveAPITester:
             }
             
             try:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/api/inventory/{inventory_id}/adjust",
                     json=adjustment_data,
                     headers=headers,
@@ -694,7 +757,7 @@ class ComprehensiveAPITester:
                 )
                 
                 success = response.status_code in [200, 201]
-                details = f"Adjustment recorded" if success else f"Failed: {response.text[:100]}"
+                details = f"Adjustment recorded" if success else f"Failed: {body_preview(response)}"
                     
                 self.log_test_result(
                     "INVENTORY", "Inventory Adjustment", f"/api/inventory/{inventory_id}/adjust", "POST",
@@ -725,7 +788,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/expenses",
                 json=expense_data,
                 headers=headers,
@@ -743,7 +806,7 @@ class ComprehensiveAPITester:
             else:
                 self.log_test_result(
                     "EXPENSES", "Record Expense", "/api/expenses", "POST",
-                    response.status_code, False, f"Failed: {response.text[:100]}"
+                    response.status_code, False, f"Failed: {body_preview(response)}"
                 )
                 
         except Exception as e:
@@ -754,7 +817,7 @@ class ComprehensiveAPITester:
         
         # 2. List Expenses
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/expenses",
                 headers=headers,
                 timeout=30,
@@ -762,7 +825,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Retrieved expenses" if success else f"Failed: {response.text[:100]}"
+            details = f"Retrieved expenses" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "EXPENSES", "List Expenses", "/api/expenses", "GET",
@@ -784,7 +847,7 @@ class ComprehensiveAPITester:
         
         # 1. Pending Orders Report (REQ-037)
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/reports/pending-orders",
                 headers=headers,
                 timeout=30,
@@ -792,7 +855,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Pending orders report generated" if success else f"Failed: {response.text[:100]}"
+            details = f"Pending orders report generated" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "REPORTS", "Pending Orders Report", "/api/reports/pending-orders", "GET",
@@ -807,7 +870,7 @@ class ComprehensiveAPITester:
         
         # 2. Production Status Report (REQ-038)
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/reports/production-status",
                 headers=headers,
                 timeout=30,
@@ -815,7 +878,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Production status report generated" if success else f"Failed: {response.text[:100]}"
+            details = f"Production status report generated" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "REPORTS", "Production Status Report", "/api/reports/production-status", "GET",
@@ -830,7 +893,7 @@ class ComprehensiveAPITester:
         
         # 3. Stock Holdings Report (REQ-039)
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/reports/stock-holdings",
                 headers=headers,
                 timeout=30,
@@ -838,7 +901,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Stock holdings report generated" if success else f"Failed: {response.text[:100]}"
+            details = f"Stock holdings report generated" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "REPORTS", "Stock Holdings Report", "/api/reports/stock-holdings", "GET",
@@ -853,7 +916,7 @@ class ComprehensiveAPITester:
         
         # 4. Pending Receivables Report (REQ-040)
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/reports/pending-receivables",
                 headers=headers,
                 timeout=30,
@@ -861,7 +924,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Pending receivables report generated" if success else f"Failed: {response.text[:100]}"
+            details = f"Pending receivables report generated" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "REPORTS", "Pending Receivables Report", "/api/reports/pending-receivables", "GET",
@@ -881,8 +944,14 @@ class ComprehensiveAPITester:
         
         headers = self.get_auth_headers()
         
-        # Note: returns.py is empty (0 bytes), so these tests will likely fail
-        # but we should test the expected endpoints
+        # Skip the HTTP round-trips entirely if the server does not register the route
+        if not self.is_registered("/api/returns"):
+            for test_name, method in (("Record Return", "POST"), ("List Returns", "GET")):
+                self.log_test_result(
+                    "RETURNS", test_name, "/api/returns", method,
+                    0, False, "Endpoint not registered"
+                )
+            return
         
         # 1. Record Return (REQ-029)
         return_data = {
@@ -895,7 +964,7 @@ class ComprehensiveAPITester:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/returns",
                 json=return_data,
                 headers=headers,
@@ -904,7 +973,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code in [200, 201]
-            details = f"Return recorded" if success else f"Failed: {response.text[:100]}"
+            details = f"Return recorded" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "RETURNS", "Record Return", "/api/returns", "POST",
@@ -919,7 +988,7 @@ class ComprehensiveAPITester:
         
         # 2. List Returns
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/returns",
                 headers=headers,
                 timeout=30,
@@ -927,7 +996,7 @@ class ComprehensiveAPITester:
             )
             
             success = response.status_code == 200
-            details = f"Retrieved returns" if success else f"Failed: {response.text[:100]}"
+            details = f"Retrieved returns" if success else f"Failed: {body_preview(response)}"
                 
             self.log_test_result(
                 "RETURNS", "List Returns", "/api/returns", "GET",
@@ -942,79 +1011,75 @@ class ComprehensiveAPITester:
     
     def generate_comprehensive_report(self):
         """Generate comprehensive test report"""
-        print("\n" + "=" * 80)
-        print("🏁 COMPREHENSIVE API TEST REPORT")
-        print("=" * 80)
+        # Collect the console report and write it to stdout in one call at the end
+        lines = ["\n" + "=" * 80, "🏁 COMPREHENSIVE API TEST REPORT", "=" * 80]
         
-        # Group results by module
-        modules = {}
+        # Group results by module and compute the overall summary in one pass
+        modules = defaultdict(lambda: {"total": 0, "passed": 0, "failed": 0})
+        total_tests = passed_tests = 0
         for result in self.test_results:
-            module = result["module"]
-            if module not in modules:
-                modules[module] = {"total": 0, "passed": 0, "failed": 0, "tests": []}
-            
-            modules[module]["total"] += 1
+            stats = modules[result["module"]]
+            stats["total"] += 1
+            total_tests += 1
             if result["success"]:
-                modules[module]["passed"] += 1
+                stats["passed"] += 1
+                passed_tests += 1
             else:
-                modules[module]["failed"] += 1
-            modules[module]["tests"].append(result)
-        
-        # Overall summary
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r["success"])
+                stats["failed"] += 1
+        modules = dict(modules)
         failed_tests = total_tests - passed_tests
         
-        print(f"📊 OVERALL SUMMARY:")
-        print(f"   Total Tests: {total_tests}")
-        print(f"   Passed: {passed_tests}")
-        print(f"   Failed: {failed_tests}")
-        print(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "0%")
+        lines.append(f"📊 OVERALL SUMMARY:")
+        lines.append(f"   Total Tests: {total_tests}")
+        lines.append(f"   Passed: {passed_tests}")
+        lines.append(f"   Failed: {failed_tests}")
+        lines.append(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "0%")
         
         # Module-wise summary
-        print(f"\n🔍 MODULE-WISE RESULTS:")
-        print(f"{'Module':<15} {'Total':<8} {'Passed':<8} {'Failed':<8} {'Rate':<10}")
-        print("-" * 55)
+        lines.append(f"\n🔍 MODULE-WISE RESULTS:")
+        lines.append(f"{'Module':<15} {'Total':<8} {'Passed':<8} {'Failed':<8} {'Rate':<10}")
+        lines.append("-" * 55)
         
         for module, stats in modules.items():
             rate = f"{(stats['passed']/stats['total']*100):.1f}%" if stats['total'] > 0 else "0%"
-            print(f"{module:<15} {stats['total']:<8} {stats['passed']:<8} {stats['failed']:<8} {rate:<10}")
+            lines.append(f"{module:<15} {stats['total']:<8} {stats['passed']:<8} {stats['failed']:<8} {rate:<10}")
         
         # Functional requirements coverage
-        print(f"\n📋 FUNCTIONAL REQUIREMENTS COVERAGE:")
+        lines.append(f"\n📋 FUNCTIONAL REQUIREMENTS COVERAGE:")
+        passed_modules = {m for m, stats in modules.items() if stats["passed"] > 0}
         req_coverage = {
-            "REQ-001/002": "Customer Management" + (" ✅" if modules.get("CUSTOMERS", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-003-009": "Order Management" + (" ✅" if modules.get("ORDERS", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-010/011": "Material In" + (" ✅" if modules.get("MATERIALS", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-015-018": "Delivery Challans" + (" ✅" if modules.get("CHALLANS", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-021-024": "GST Invoices" + (" ✅" if modules.get("INVOICES", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-025-028": "Payment Recording" + (" ✅" if modules.get("PAYMENTS", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-029-031": "Returns Management" + (" ✅" if modules.get("RETURNS", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-032-035": "Inventory Management" + (" ✅" if modules.get("INVENTORY", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-036": "Expense Recording" + (" ✅" if modules.get("EXPENSES", {}).get("passed", 0) > 0 else " ❌"),
-            "REQ-037-045": "Reporting" + (" ✅" if modules.get("REPORTS", {}).get("passed", 0) > 0 else " ❌"),
+            req: f"{label} {'✅' if module in passed_modules else '❌'}"
+            for req, label, module in REQUIREMENTS_MAP
         }
         
         for req, status in req_coverage.items():
-            print(f"   {req}: {status}")
+            lines.append(f"   {req}: {status}")
         
         # Save detailed report
         report_filename = f"comprehensive_api_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_filename, 'w') as f:
-            json.dump({
-                "summary": {
-                    "total_tests": total_tests,
-                    "passed": passed_tests,
-                    "failed": failed_tests,
-                    "success_rate": f"{(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "0%"
-                },
-                "modules": modules,
-                "requirements_coverage": req_coverage,
-                "detailed_results": self.test_results
-            }, f, indent=2)
-        
-        print(f"\n💾 Detailed report saved to: {report_filename}")
-        print("=" * 80)
+        # Per-module entries only carry counts; the individual tests live in detailed_results
+        report = {
+            "summary": {
+                "total_tests": total_tests,
+                "passed": passed_tests,
+                "failed": failed_tests,
+                "success_rate": f"{(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "0%"
+            },
+            "modules": modules,
+            "requirements_coverage": req_coverage,
+            "detailed_results": self.test_results
+        }
+        if orjson is not None:
+            with open(report_filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_filename, 'w') as f:
+                json.dump(report, f, indent=2)
+        
+        lines.append(f"\n💾 Detailed report saved to: {report_filename}")
+        lines.append("=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         return {
             "total_tests": total_tests,
@@ -1039,7 +1104,7 @@ class ComprehensiveAPITester:
 ╚══════════════════════════════════════════════════════════════════════════╝
         """)
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Authenticate first
         if not self.authenticate():
@@ -1058,8 +1123,8 @@ class ComprehensiveAPITester:
         self.test_expenses_api()       # REQ-036
         self.test_reports_api()        # REQ-037 to REQ-045
         
-        end_time = time.time()
-        print(f"\n⏱️  Total testing time: {end_time - start_time:.2f} seconds")
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+        print(f"\n⏱️  Total testing time: {elapsed:.2f} seconds")
         
         return self.generate_comprehensive_report()
 
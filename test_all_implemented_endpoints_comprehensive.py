@@ -7,19 +7,105 @@ Tests every endpoint found in the backend/app/api/ directory
 
 import requests
 import json
-import uuid
+import secrets
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json for the results files
+    orjson = None
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 API_URL = f"{BASE_URL}/api"
+# Fixed endpoint URLs, built once; parameterized paths are still formatted per call
+_URL = {
+    "challans": f"{API_URL}/challans",
+    "customers": f"{API_URL}/customers",
+    "customers_search": f"{API_URL}/customers/search?query=Test",
+    "expenses": f"{API_URL}/expenses",
+    "inventory": f"{API_URL}/inventory",
+    "inventory_low_stock": f"{API_URL}/inventory/low-stock",
+    "invoices": f"{API_URL}/invoices",
+    "login": f"{API_URL}/auth/login",
+    "materials_in": f"{API_URL}/materials/in",
+    "materials_out": f"{API_URL}/materials/out",
+    "orders": f"{API_URL}/orders",
+    "payments": f"{API_URL}/payments",
+    "returns": f"{API_URL}/returns",
+    "users": f"{API_URL}/users",
+    "users_me": f"{API_URL}/users/me"
+}
+POOL_SIZE = 32
+
+# (module, test name, url, response field, label) for the unauthenticated service probes
+HEALTH_PROBES = (
+    ("HEALTH", "Health Check", f"{BASE_URL}/health", "status", "Status"),
+    ("HEALTH", "Database Health", f"{BASE_URL}/health/db", "database", "DB"),
+    ("INFO", "Version Info", f"{BASE_URL}/version", "version", "Version"),
+    ("DEBUG", "Enum Check", f"{BASE_URL}/debug/enum-check", "app_version", "App Version"),
+)
+# (test name, url, noun for the row count)
+REPORTS = (
+    ("Pending Orders", f"{API_URL}/reports/pending-orders", "pending orders"),
+    ("Production Status", f"{API_URL}/reports/production-status", "production items"),
+    ("Stock Holdings", f"{API_URL}/reports/stock-holdings", "stock items"),
+    ("Outstanding Receivables", f"{API_URL}/reports/outstanding-receivables", "receivables"),
+)
+
+# Request bodies that do not depend on created IDs; read-only, copied with dict() where sent
+ORDER_ITEM = MappingProxyType({
+    "material_type": "saree",
+    "quantity": 2,
+    "unit_price": 750.00,
+    "customization_details": "Red with gold border"
+})
+INVENTORY_ITEM = MappingProxyType({
+    "category": "Test Category",
+    "current_stock": 100.0,
+    "unit": "pieces",
+    "reorder_level": 10.0,
+    "cost_per_unit": 25.50,
+    "supplier_name": "Test Supplier",
+    "supplier_contact": "9876543210"
+})
+INVENTORY_ADJUSTMENT = MappingProxyType({
+    "adjustment_type": "quantity_change",
+    "quantity_change": 5.0,
+    "reason": "Test adjustment",
+    "notes": "Comprehensive testing"
+})
+EXPENSE = MappingProxyType({
+    "expense_type": "material_cost",
+    "amount": 1250.75,
+    "description": "Test expense recording",
+    "vendor_name": "Test Vendor"
+})
 
 class AllEndpointsComprehensiveTester:
     def __init__(self):
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.access_token = None
+        self._t0 = time.time()
+        self._t0_perf = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache: Dict[str, requests.Response] = {}
+        self._local = threading.local()
         self.test_results = {
             "passed": 0,
             "failed": 0,
@@ -37,31 +123,57 @@ class AllEndpointsComprehensiveTester:
             "status": "PASS" if success else "FAIL",
             "details": details,
             "data": data,
-            "timestamp": datetime.now().isoformat()
+            # Offset from the start of the run; converted to wall-clock time only in the results files
+            "ts_ns": time.perf_counter_ns() - self._t0_perf
         }
-        self.test_results["details"].append(result)
-        self.test_results["total"] += 1
         if success:
-            self.test_results["passed"] += 1
-            print(f"✅ {module}: {test_name}")
-            if details:
-                print(f"   📝 {details}")
+            message = f"✅ {module}: {test_name}" + (f"\n   📝 {details}" if details else "")
+        else:
+            message = f"❌ {module}: {test_name}" + (f"\n   💥 {details}" if details else "")
+        # Module groups run on worker threads, so counters share the lock
+        with self._lock:
+            self.test_results["details"].append(result)
+            self.test_results["total"] += 1
+            self.test_results["passed" if success else "failed"] += 1
+            self.emit(message)
+
+    def wall_time(self, ts_ns: int) -> str:
+        """ISO timestamp for a perf_counter_ns offset recorded by log_test"""
+        return datetime.fromtimestamp(self._t0 + ts_ns / 1e9).isoformat()
+
+    def emit(self, message: str):
+        """Print a line, or hold it back when the calling thread runs a buffered module group"""
+        lines = getattr(self._local, "lines", None)
+        if lines is None:
+            print(message)
         else:
-            self.test_results["failed"] += 1
-            print(f"❌ {module}: {test_name}")
-            if details:
-                print(f"   💥 {details}")
+            lines.append(message)
+
+    def _collect(self, call) -> List[str]:
+        """Run call with a fresh buffer on this thread and return the lines it emitted"""
+        self._local.lines = []
+        try:
+            call()
+            return self._local.lines
+        finally:
+            self._local.lines = None
+
+    def _run_buffered(self, group):
+        """Run a module group and print its output as one block once it finishes"""
+        lines = self._collect(group)
+        with self._lock:
+            print("\n".join(lines), flush=True)
 
     def authenticate(self) -> bool:
         """Authenticate and get access token"""
-        print("\n🔐 AUTHENTICATING...")
+        self.emit("\n🔐 AUTHENTICATING...")
         try:
             auth_data = {
                 "username": "admin",
                 "password": os.getenv("TEST_PASSWORD", "change-me")
             }
             response = self.session.post(
-                f"{API_URL}/auth/login",
+                _URL["login"],
                 data=auth_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
                 timeout=10
@@ -71,65 +183,90 @@ class AllEndpointsComprehensiveTester:
                 token_data = response.json()
                 self.access_token = token_data["access_token"]
                 self.session.headers.update({"Authorization": f"Bearer {self.access_token}"})
-                print(f"✅ Authentication successful")
+                self.emit(f"✅ Authentication successful")
                 return True
             else:
-                print(f"❌ Authentication failed: {response.status_code} - {response.text}")
+                self.emit(f"❌ Authentication failed: {response.status_code} - {response.text}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Authentication error: {str(e)}")
+            self.emit(f"❌ Authentication error: {str(e)}")
             return False
 
-    def test_health_endpoints(self):
-        """Test health and info endpoints"""
-        print("\n🏥 TESTING HEALTH & INFO ENDPOINTS")
-        print("=" * 60)
-        
-        # Health check
-        try:
-            response = self.session.get(f"{BASE_URL}/health", timeout=10)
-            if response.status_code == 200:
-                self.log_test("HEALTH", "Health Check", True, f"Status: {response.json().get('status')}")
-            else:
-                self.log_test("HEALTH", "Health Check", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("HEALTH", "Health Check", False, str(e))
+    def _get_cached(self, url: str) -> requests.Response:
+        """GET a URL once per run and share the response between module groups"""
+        # Held across the request so a concurrent caller waits for the first fetch
+        with self._cache_lock:
+            if url not in self._cache:
+                self._cache[url] = self.session.get(url)
+            return self._cache[url]
 
-        # Database health
-        try:
-            response = self.session.get(f"{BASE_URL}/health/db", timeout=10)
-            if response.status_code == 200:
-                self.log_test("HEALTH", "Database Health", True, f"DB: {response.json().get('database')}")
-            else:
-                self.log_test("HEALTH", "Database Health", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("HEALTH", "Database Health", False, str(e))
+    def _api(self, method: str, url: str, module: str, test_name: str, payload: Any = None,
+             expect: tuple = (200,), describe=None, cached: bool = False, timeout: Optional[float] = None) -> Optional[Any]:
+        """Issue one request, log it as PASS/FAIL and return the decoded body on success.
 
-        # Version info
+        describe(body) builds the PASS details; cached=True shares one GET per URL across groups.
+        """
         try:
-            response = self.session.get(f"{BASE_URL}/version", timeout=10)
-            if response.status_code == 200:
-                self.log_test("INFO", "Version Info", True, f"Version: {response.json().get('version')}")
+            if cached:
+                response = self._get_cached(url)
             else:
-                self.log_test("INFO", "Version Info", False, f"Status: {response.status_code}")
+                response = self.session.request(method, url, json=payload, timeout=timeout)
+            if response.status_code not in expect:
+                # Only failed writes echo the body; validation errors explain themselves
+                details = f"Status: {response.status_code}"
+                if method == "POST":
+                    details += f" - {response.text}"
+                self.log_test(module, test_name, False, details)
+                return None
+            body = response.json()
+            self.log_test(module, test_name, True, describe(body) if describe else "")
+            return body
         except Exception as e:
-            self.log_test("INFO", "Version Info", False, str(e))
+            self.log_test(module, test_name, False, str(e))
+            return None
+
+    def _list(self, url: str, module: str, test_name: str, noun: str) -> Optional[Any]:
+        """GET a collection endpoint and log how many entries it returned"""
+        return self._api("GET", url, module, test_name, describe=lambda body: f"Found {len(body)} {noun}")
+
+    def _prerequisite(self, *keys: str, module: str, test_name: str) -> Optional[Any]:
+        """Return the first created ID among keys; if none exists, log one skipped FAIL instead"""
+        for key in keys:
+            value = self.test_results["created_data"].get(key)
+            if value:
+                return value
+        self.log_test(module, test_name, False, f"Skipped: missing {' or '.join(keys)}")
+        return None
+
+    def _fan_out(self, calls):
+        """Run independent checks concurrently; their output joins the caller's in call order"""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(self._collect, call) for call in calls]
+        for future in futures:
+            for line in future.result():
+                self.emit(line)
+
+    def _run_probes(self, probes):
+        """Run (module, test name, url, response field, label) rows as concurrent GET checks"""
+        self._fan_out([
+            lambda module=module, test_name=test_name, url=url, field=field, label=label: self._api(
+                "GET", url, module, test_name, timeout=10,
+                describe=lambda body: f"{label}: {body.get(field)}")
+            for module, test_name, url, field, label in probes
+        ])
 
-        # Debug enum check
-        try:
-            response = self.session.get(f"{BASE_URL}/debug/enum-check", timeout=10)
-            if response.status_code == 200:
-                self.log_test("DEBUG", "Enum Check", True, f"App Version: {response.json().get('app_version')}")
-            else:
-                self.log_test("DEBUG", "Enum Check", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("DEBUG", "Enum Check", False, str(e))
+    def test_health_endpoints(self):
+        """Test health and info endpoints"""
+        self.emit("\n🏥 TESTING HEALTH & INFO ENDPOINTS")
+        self.emit("=" * 60)
+        
+        self._run_probes(HEALTH_PROBES)
 
     def test_auth_endpoints(self):
         """Test authentication endpoints"""
-        print("\n🔐 TESTING AUTH ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n🔐 TESTING AUTH ENDPOINTS")
+        self.emit("=" * 60)
         
         # Login (already tested in authenticate, but log it)
         if self.access_token:
@@ -138,64 +275,32 @@ class AllEndpointsComprehensiveTester:
             self.log_test("AUTH", "Login", False, "No token received")
 
         # Test protected endpoint to verify token
-        try:
-            response = self.session.get(f"{API_URL}/users/me")
-            if response.status_code == 200:
-                user_data = response.json()
-                self.log_test("AUTH", "Token Validation", True, f"User: {user_data.get('username')}")
-            else:
-                self.log_test("AUTH", "Token Validation", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("AUTH", "Token Validation", False, str(e))
+        self._api("GET", _URL["users_me"], "AUTH", "Token Validation", cached=True,
+                  describe=lambda user: f"User: {user.get('username')}")
 
     def test_users_endpoints(self):
         """Test users endpoints"""
-        print("\n👥 TESTING USERS ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n👥 TESTING USERS ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List users
-        try:
-            response = self.session.get(f"{API_URL}/users")
-            if response.status_code == 200:
-                users = response.json()
-                self.log_test("USERS", "List Users", True, f"Found {len(users)} users")
-            else:
-                self.log_test("USERS", "List Users", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("USERS", "List Users", False, str(e))
+        self._list(_URL["users"], "USERS", "List Users", "users")
 
-        # Get current user
-        try:
-            response = self.session.get(f"{API_URL}/users/me")
-            if response.status_code == 200:
-                user = response.json()
-                self.log_test("USERS", "Get Current User", True, f"User ID: {user.get('id')}")
-                self.test_results["created_data"]["current_user_id"] = user.get("id")
-            else:
-                self.log_test("USERS", "Get Current User", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("USERS", "Get Current User", False, str(e))
+        user = self._api("GET", _URL["users_me"], "USERS", "Get Current User", cached=True,
+                         describe=lambda user: f"User ID: {user.get('id')}")
+        if user:
+            self.test_results["created_data"]["current_user_id"] = user.get("id")
 
     def test_customers_endpoints(self):
         """Test customers endpoints"""
-        print("\n👤 TESTING CUSTOMERS ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n👤 TESTING CUSTOMERS ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List customers
-        try:
-            response = self.session.get(f"{API_URL}/customers")
-            if response.status_code == 200:
-                customers = response.json()
-                self.log_test("CUSTOMERS", "List Customers", True, f"Found {len(customers)} customers")
-                if customers:
-                    self.test_results["created_data"]["existing_customer_id"] = customers[0]["id"]
-            else:
-                self.log_test("CUSTOMERS", "List Customers", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("CUSTOMERS", "List Customers", False, str(e))
+        customers = self._list(_URL["customers"], "CUSTOMERS", "List Customers", "customers")
+        if customers:
+            self.test_results["created_data"]["existing_customer_id"] = customers[0]["id"]
 
         # Create customer
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = secrets.token_hex(4)
         customer_data = {
             "name": f"Test Customer {unique_id}",
             "phone": f"9876543{unique_id[:3]}",
@@ -204,170 +309,77 @@ class AllEndpointsComprehensiveTester:
             "gst_number": f"12ABCDE{unique_id[:4]}F7G8"
         }
         
-        try:
-            response = self.session.post(f"{API_URL}/customers", json=customer_data)
-            if response.status_code == 201:
-                customer = response.json()
-                self.test_results["created_data"]["customer_id"] = customer["id"]
-                self.log_test("CUSTOMERS", "Create Customer", True, f"Created: {customer['id']}")
-            else:
-                self.log_test("CUSTOMERS", "Create Customer", False, f"Status: {response.status_code} - {response.text}")
-        except Exception as e:
-            self.log_test("CUSTOMERS", "Create Customer", False, str(e))
+        customer = self._api("POST", _URL["customers"], "CUSTOMERS", "Create Customer",
+                             payload=customer_data, expect=(201,),
+                             describe=lambda customer: f"Created: {customer['id']}")
+        if customer:
+            self.test_results["created_data"]["customer_id"] = customer["id"]
 
-        # Search customers
-        try:
-            response = self.session.get(f"{API_URL}/customers/search?query=Test")
-            if response.status_code == 200:
-                results = response.json()
-                self.log_test("CUSTOMERS", "Search Customers", True, f"Found {len(results)} results")
-            else:
-                self.log_test("CUSTOMERS", "Search Customers", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("CUSTOMERS", "Search Customers", False, str(e))
+        self._list(_URL["customers_search"], "CUSTOMERS", "Search Customers", "results")
 
     def test_orders_endpoints(self):
         """Test orders endpoints"""
-        print("\n📋 TESTING ORDERS ENDPOINTS")
-        print("=" * 60)
-        
-        customer_id = self.test_results["created_data"].get("customer_id") or self.test_results["created_data"].get("existing_customer_id")
+        self.emit("\n📋 TESTING ORDERS ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List orders
-        try:
-            response = self.session.get(f"{API_URL}/orders")
-            if response.status_code == 200:
-                orders = response.json()
-                self.log_test("ORDERS", "List Orders", True, f"Found {len(orders)} orders")
-                if orders:
-                    self.test_results["created_data"]["existing_order_id"] = orders[0]["id"]
-            else:
-                self.log_test("ORDERS", "List Orders", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("ORDERS", "List Orders", False, str(e))
+        orders = self._list(_URL["orders"], "ORDERS", "List Orders", "orders")
+        if orders:
+            self.test_results["created_data"]["existing_order_id"] = orders[0]["id"]
 
         # Create order (if we have customer)
+        customer_id = self._prerequisite("customer_id", "existing_customer_id", module="ORDERS", test_name="Create Order")
         if customer_id:
             order_data = {
                 "customer_id": customer_id,
                 "notes": "Comprehensive test order",
-                "order_items": [
-                    {
-                        "material_type": "saree",
-                        "quantity": 2,
-                        "unit_price": 750.00,
-                        "customization_details": "Red with gold border"
-                    }
-                ]
+                "order_items": [dict(ORDER_ITEM)]
             }
             
-            try:
-                response = self.session.post(f"{API_URL}/orders", json=order_data)
-                if response.status_code == 201:
-                    order = response.json()
-                    self.test_results["created_data"]["order_id"] = order["id"]
-                    self.log_test("ORDERS", "Create Order", True, f"Created: {order['order_number']}")
-                else:
-                    self.log_test("ORDERS", "Create Order", False, f"Status: {response.status_code} - {response.text}")
-            except Exception as e:
-                self.log_test("ORDERS", "Create Order", False, str(e))
-        else:
-            self.log_test("ORDERS", "Create Order", False, "No customer ID available")
+            order = self._api("POST", _URL["orders"], "ORDERS", "Create Order",
+                              payload=order_data, expect=(201,),
+                              describe=lambda order: f"Created: {order['order_number']}")
+            if order:
+                self.test_results["created_data"]["order_id"] = order["id"]
 
     def test_inventory_endpoints(self):
         """Test inventory endpoints"""
-        print("\n📦 TESTING INVENTORY ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n📦 TESTING INVENTORY ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List inventory
-        try:
-            response = self.session.get(f"{API_URL}/inventory")
-            if response.status_code == 200:
-                items = response.json()
-                self.log_test("INVENTORY", "List Items", True, f"Found {len(items)} items")
-                if items:
-                    self.test_results["created_data"]["existing_inventory_id"] = items[0]["id"]
-            else:
-                self.log_test("INVENTORY", "List Items", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("INVENTORY", "List Items", False, str(e))
+        items = self._list(_URL["inventory"], "INVENTORY", "List Items", "items")
+        if items:
+            self.test_results["created_data"]["existing_inventory_id"] = items[0]["id"]
 
         # Create inventory item
-        unique_id = str(uuid.uuid4())[:8]
-        item_data = {
-            "item_name": f"Test Item {unique_id}",
-            "category": "Test Category",
-            "current_stock": 100.0,
-            "unit": "pieces",
-            "reorder_level": 10.0,
-            "cost_per_unit": 25.50,
-            "supplier_name": "Test Supplier",
-            "supplier_contact": "9876543210"
-        }
+        unique_id = secrets.token_hex(4)
+        item_data = {"item_name": f"Test Item {unique_id}", **INVENTORY_ITEM}
         
-        try:
-            response = self.session.post(f"{API_URL}/inventory", json=item_data)
-            if response.status_code == 201:
-                item = response.json()
-                self.test_results["created_data"]["inventory_id"] = item["id"]
-                self.log_test("INVENTORY", "Create Item", True, f"Created: {item['item_name']}")
-            else:
-                self.log_test("INVENTORY", "Create Item", False, f"Status: {response.status_code} - {response.text}")
-        except Exception as e:
-            self.log_test("INVENTORY", "Create Item", False, str(e))
+        item = self._api("POST", _URL["inventory"], "INVENTORY", "Create Item",
+                         payload=item_data, expect=(201,),
+                         describe=lambda item: f"Created: {item['item_name']}")
+        if item:
+            self.test_results["created_data"]["inventory_id"] = item["id"]
 
         # Test inventory adjustment (with fixed approach)
-        inventory_id = self.test_results["created_data"].get("inventory_id") or self.test_results["created_data"].get("existing_inventory_id")
+        inventory_id = self._prerequisite("inventory_id", "existing_inventory_id", module="INVENTORY", test_name="Adjust Stock")
         if inventory_id:
-            adjustment_data = {
-                "adjustment_type": "quantity_change",
-                "quantity_change": 5.0,
-                "reason": "Test adjustment",
-                "notes": "Comprehensive testing"
-            }
+            adjustment_data = dict(INVENTORY_ADJUSTMENT)
             
-            try:
-                response = self.session.post(f"{API_URL}/inventory/{inventory_id}/adjust", json=adjustment_data)
-                if response.status_code == 201:
-                    result = response.json()
-                    self.log_test("INVENTORY", "Adjust Stock", True, f"Adjusted by {adjustment_data['quantity_change']}")
-                else:
-                    self.log_test("INVENTORY", "Adjust Stock", False, f"Status: {response.status_code} - {response.text}")
-            except Exception as e:
-                self.log_test("INVENTORY", "Adjust Stock", False, str(e))
-        else:
-            self.log_test("INVENTORY", "Adjust Stock", False, "No inventory ID available")
+            self._api("POST", f"{API_URL}/inventory/{inventory_id}/adjust", "INVENTORY", "Adjust Stock",
+                      payload=adjustment_data, expect=(201,),
+                      describe=lambda result: f"Adjusted by {adjustment_data['quantity_change']}")
 
-        # Low stock items
-        try:
-            response = self.session.get(f"{API_URL}/inventory/low-stock")
-            if response.status_code == 200:
-                items = response.json()
-                self.log_test("INVENTORY", "Low Stock Items", True, f"Found {len(items)} low stock items")
-            else:
-                self.log_test("INVENTORY", "Low Stock Items", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("INVENTORY", "Low Stock Items", False, str(e))
+        self._list(_URL["inventory_low_stock"], "INVENTORY", "Low Stock Items", "low stock items")
 
     def test_materials_endpoints(self):
         """Test materials endpoints"""
-        print("\n🧵 TESTING MATERIALS ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n🧵 TESTING MATERIALS ENDPOINTS")
+        self.emit("=" * 60)
         
-        customer_id = self.test_results["created_data"].get("customer_id") or self.test_results["created_data"].get("existing_customer_id")
-        
-        # List material in
-        try:
-            response = self.session.get(f"{API_URL}/materials/in")
-            if response.status_code == 200:
-                materials = response.json()
-                self.log_test("MATERIALS", "List Material In", True, f"Found {len(materials)} records")
-            else:
-                self.log_test("MATERIALS", "List Material In", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("MATERIALS", "List Material In", False, str(e))
+        self._list(_URL["materials_in"], "MATERIALS", "List Material In", "records")
 
         # Record material in (if we have customer)
+        customer_id = self._prerequisite("customer_id", "existing_customer_id", module="MATERIALS", test_name="Record Material In")
         if customer_id:
             material_data = {
                 "customer_id": customer_id,
@@ -377,178 +389,68 @@ class AllEndpointsComprehensiveTester:
                 "notes": "Test material recording"
             }
             
-            try:
-                response = self.session.post(f"{API_URL}/materials/in", json=material_data)
-                if response.status_code == 201:
-                    material = response.json()
-                    self.test_results["created_data"]["material_in_id"] = material["id"]
-                    self.log_test("MATERIALS", "Record Material In", True, f"Recorded: {material['id']}")
-                else:
-                    self.log_test("MATERIALS", "Record Material In", False, f"Status: {response.status_code} - {response.text}")
-            except Exception as e:
-                self.log_test("MATERIALS", "Record Material In", False, str(e))
-        else:
-            self.log_test("MATERIALS", "Record Material In", False, "No customer ID available")
+            material = self._api("POST", _URL["materials_in"], "MATERIALS", "Record Material In",
+                                 payload=material_data, expect=(201,),
+                                 describe=lambda material: f"Recorded: {material['id']}")
+            if material:
+                self.test_results["created_data"]["material_in_id"] = material["id"]
 
-        # List material out
-        try:
-            response = self.session.get(f"{API_URL}/materials/out")
-            if response.status_code == 200:
-                materials = response.json()
-                self.log_test("MATERIALS", "List Material Out", True, f"Found {len(materials)} records")
-            else:
-                self.log_test("MATERIALS", "List Material Out", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("MATERIALS", "List Material Out", False, str(e))
+        self._list(_URL["materials_out"], "MATERIALS", "List Material Out", "records")
 
     def test_expenses_endpoints(self):
         """Test expenses endpoints"""
-        print("\n💸 TESTING EXPENSES ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n💸 TESTING EXPENSES ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List expenses
-        try:
-            response = self.session.get(f"{API_URL}/expenses")
-            if response.status_code == 200:
-                expenses = response.json()
-                self.log_test("EXPENSES", "List Expenses", True, f"Found {len(expenses)} expenses")
-            else:
-                self.log_test("EXPENSES", "List Expenses", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("EXPENSES", "List Expenses", False, str(e))
+        self._list(_URL["expenses"], "EXPENSES", "List Expenses", "expenses")
 
         # Record expense
-        expense_data = {
-            "expense_type": "material_cost",
-            "amount": 1250.75,
-            "description": "Test expense recording",
-            "expense_date": datetime.now().isoformat(),
-            "vendor_name": "Test Vendor"
-        }
+        expense_data = {**EXPENSE, "expense_date": datetime.now().isoformat()}
         
-        try:
-            response = self.session.post(f"{API_URL}/expenses", json=expense_data)
-            if response.status_code == 201:
-                expense = response.json()
-                self.test_results["created_data"]["expense_id"] = expense["id"]
-                self.log_test("EXPENSES", "Record Expense", True, f"Recorded: ₹{expense['amount']}")
-            else:
-                self.log_test("EXPENSES", "Record Expense", False, f"Status: {response.status_code} - {response.text}")
-        except Exception as e:
-            self.log_test("EXPENSES", "Record Expense", False, str(e))
+        expense = self._api("POST", _URL["expenses"], "EXPENSES", "Record Expense",
+                            payload=expense_data, expect=(201,),
+                            describe=lambda expense: f"Recorded: ₹{expense['amount']}")
+        if expense:
+            self.test_results["created_data"]["expense_id"] = expense["id"]
 
     def test_payments_endpoints(self):
         """Test payments endpoints"""
-        print("\n💰 TESTING PAYMENTS ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n💰 TESTING PAYMENTS ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List payments
-        try:
-            response = self.session.get(f"{API_URL}/payments")
-            if response.status_code == 200:
-                payments = response.json()
-                self.log_test("PAYMENTS", "List Payments", True, f"Found {len(payments)} payments")
-            else:
-                self.log_test("PAYMENTS", "List Payments", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("PAYMENTS", "List Payments", False, str(e))
+        self._list(_URL["payments"], "PAYMENTS", "List Payments", "payments")
 
     def test_invoices_endpoints(self):
         """Test invoices endpoints"""
-        print("\n🧾 TESTING INVOICES ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n🧾 TESTING INVOICES ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List invoices
-        try:
-            response = self.session.get(f"{API_URL}/invoices")
-            if response.status_code == 200:
-                invoices = response.json()
-                self.log_test("INVOICES", "List Invoices", True, f"Found {len(invoices)} invoices")
-            else:
-                self.log_test("INVOICES", "List Invoices", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("INVOICES", "List Invoices", False, str(e))
+        self._list(_URL["invoices"], "INVOICES", "List Invoices", "invoices")
 
     def test_challans_endpoints(self):
         """Test challans endpoints"""
-        print("\n📄 TESTING CHALLANS ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n📄 TESTING CHALLANS ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List challans
-        try:
-            response = self.session.get(f"{API_URL}/challans")
-            if response.status_code == 200:
-                challans = response.json()
-                self.log_test("CHALLANS", "List Challans", True, f"Found {len(challans)} challans")
-            else:
-                self.log_test("CHALLANS", "List Challans", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("CHALLANS", "List Challans", False, str(e))
+        self._list(_URL["challans"], "CHALLANS", "List Challans", "challans")
 
     def test_returns_endpoints(self):
         """Test returns endpoints"""
-        print("\n🔄 TESTING RETURNS ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n🔄 TESTING RETURNS ENDPOINTS")
+        self.emit("=" * 60)
         
-        # List returns
-        try:
-            response = self.session.get(f"{API_URL}/returns")
-            if response.status_code == 200:
-                returns = response.json()
-                self.log_test("RETURNS", "List Returns", True, f"Found {len(returns)} returns")
-            else:
-                self.log_test("RETURNS", "List Returns", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("RETURNS", "List Returns", False, str(e))
+        self._list(_URL["returns"], "RETURNS", "List Returns", "returns")
 
     def test_reports_endpoints(self):
         """Test reports endpoints"""
-        print("\n📊 TESTING REPORTS ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n📊 TESTING REPORTS ENDPOINTS")
+        self.emit("=" * 60)
         
-        # Pending orders report
-        try:
-            response = self.session.get(f"{API_URL}/reports/pending-orders")
-            if response.status_code == 200:
-                report = response.json()
-                self.log_test("REPORTS", "Pending Orders", True, f"Found {len(report)} pending orders")
-            else:
-                self.log_test("REPORTS", "Pending Orders", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("REPORTS", "Pending Orders", False, str(e))
-
-        # Production status report
-        try:
-            response = self.session.get(f"{API_URL}/reports/production-status")
-            if response.status_code == 200:
-                report = response.json()
-                self.log_test("REPORTS", "Production Status", True, f"Found {len(report)} production items")
-            else:
-                self.log_test("REPORTS", "Production Status", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("REPORTS", "Production Status", False, str(e))
-
-        # Stock holdings report
-        try:
-            response = self.session.get(f"{API_URL}/reports/stock-holdings")
-            if response.status_code == 200:
-                report = response.json()
-                self.log_test("REPORTS", "Stock Holdings", True, f"Found {len(report)} stock items")
-            else:
-                self.log_test("REPORTS", "Stock Holdings", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("REPORTS", "Stock Holdings", False, str(e))
-
-        # Outstanding receivables report
-        try:
-            response = self.session.get(f"{API_URL}/reports/outstanding-receivables")
-            if response.status_code == 200:
-                report = response.json()
-                self.log_test("REPORTS", "Outstanding Receivables", True, f"Found {len(report)} receivables")
-            else:
-                self.log_test("REPORTS", "Outstanding Receivables", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("REPORTS", "Outstanding Receivables", False, str(e))
+        # The report endpoints share no state, so they are fetched concurrently
+        self._fan_out([
+            lambda test_name=test_name, url=url, noun=noun: self._list(url, "REPORTS", test_name, noun)
+            for test_name, url, noun in REPORTS
+        ])
 
     def generate_summary_report(self):
         """Generate comprehensive test summary"""
@@ -601,41 +503,67 @@ class AllEndpointsComprehensiveTester:
         # Save results
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"comprehensive_endpoint_test_{timestamp}.json"
-        with open(filename, 'w') as f:
-            json.dump(self.test_results, f, indent=2, default=str)
+        # One result per line alongside the full dump, for streaming analysis
+        details_filename = f"comprehensive_endpoint_test_{timestamp}.jsonl"
+        details = [dict(r, timestamp=self.wall_time(r["ts_ns"])) for r in self.test_results["details"]]
+        payload = dict(self.test_results, details=details)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str))
+            with open(details_filename, 'wb') as f:
+                for result in details:
+                    f.write(orjson.dumps(result, default=str) + b"\n")
+        else:
+            with open(filename, 'w') as f:
+                json.dump(payload, f, indent=2, default=str)
+            with open(details_filename, 'w') as f:
+                for result in details:
+                    f.write(json.dumps(result, default=str) + "\n")
         print(f"\n📄 Detailed results saved to: {filename}")
+        print(f"📄 Per-test results saved to: {details_filename}")
+
+    def run_dependent_chain(self):
+        """Run the module groups that depend on IDs created by earlier groups"""
+        self.test_customers_endpoints()
+        # Orders and materials only need the customer ID, not each other's records
+        self._fan_out([self.test_orders_endpoints, self.test_materials_endpoints])
 
     def run_all_tests(self):
         """Run all endpoint tests"""
         start_time = time.time()
         
-        print("🧪 Comprehensive Endpoint Testing for Digital Textile Printing System")
-        print("Make sure your local backend is running on http://localhost:8000")
-        print("=" * 80)
-        print("🚀 TESTING ALL IMPLEMENTED API ENDPOINTS")
-        print("=" * 80)
+        self.emit("🧪 Comprehensive Endpoint Testing for Digital Textile Printing System")
+        self.emit("Make sure your local backend is running on http://localhost:8000")
+        self.emit("=" * 80)
+        self.emit("🚀 TESTING ALL IMPLEMENTED API ENDPOINTS")
+        self.emit("=" * 80)
         
         if not self.authenticate():
-            print("❌ Authentication failed. Cannot proceed with tests.")
+            self.emit("❌ Authentication failed. Cannot proceed with tests.")
             return False
         
-        # Test all endpoint modules
-        self.test_health_endpoints()
-        self.test_auth_endpoints()
-        self.test_users_endpoints()
-        self.test_customers_endpoints()
-        self.test_orders_endpoints()
-        self.test_inventory_endpoints()
-        self.test_materials_endpoints()
-        self.test_expenses_endpoints()
-        self.test_payments_endpoints()
-        self.test_invoices_endpoints()
-        self.test_challans_endpoints()
-        self.test_returns_endpoints()
-        self.test_reports_endpoints()
+        # Orders and materials wait for the customer the chain creates; the remaining
+        # modules are independent and run alongside it
+        groups = [
+            self.test_health_endpoints,
+            self.test_auth_endpoints,
+            self.test_users_endpoints,
+            self.run_dependent_chain,
+            self.test_inventory_endpoints,
+            self.test_expenses_endpoints,
+            self.test_payments_endpoints,
+            self.test_invoices_endpoints,
+            self.test_challans_endpoints,
+            self.test_returns_endpoints,
+            self.test_reports_endpoints,
+        ]
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [executor.submit(self._run_buffered, group) for group in groups]
+            for future in as_completed(futures):
+                future.result()
         
         end_time = time.time()
-        print(f"\n⏱️  Total testing time: {end_time - start_time:.2f} seconds")
+        self.emit(f"\n⏱️  Total testing time: {end_time - start_time:.2f} seconds")
         
         self.generate_summary_report()
         return True
@@ -8,11 +8,14 @@ import requests
 import json
 import os
 from datetime import datetime
+from jbms_test_client import SESSION, error_body
 
 # Configuration
 API_BASE_URL = "https://jbms1.onrender.com"  # ✅ Update with your Render URL
 USERNAME = "admin"
 PASSWORD = os.getenv("TEST_PASSWORD", "change-me")
+# Set VERBOSE=1 to print a preview of every successful response body
+VERBOSE = os.getenv("VERBOSE") == "1"
 
 class APITester:
     def __init__(self, base_url, username, password):
@@ -20,7 +23,7 @@ class APITester:
         self.username = username
         self.password = os.getenv("TEST_PASSWORD", "change-me")
         self.token = None
-        self.session = requests.Session()
+        self.session = SESSION
         
     def print_result(self, test_name, response, expected_status=200):
         """Print test results in a formatted way"""
@@ -29,13 +32,15 @@ class APITester:
         print(f"Status: {response.status_code} (expected: {expected_status})")
         
         if response.status_code != expected_status:
-            print(f"Error: {response.text}")
-        else:
+            print(f"Error: {error_body(response)}")
+        elif VERBOSE:
             try:
                 data = response.json()
                 print(f"Response: {json.dumps(data, indent=2)[:200]}...")
             except:
                 print(f"Response: {response.text[:200]}...")
+        # The body is already buffered (callers can still .json() it); hand the socket back now
+        response.close()
         print("-" * 50)
 
     def test_health(self):
@@ -222,9 +227,9 @@ def main():
         print("Edit the API_BASE_URL variable in this script with your Render URL")
         return
     
-    if PASSWORD = os.getenv("TEST_PASSWORD", "change-me"):
+    if not PASSWORD or PASSWORD == "change-me":
         print("❌ ERROR: Please set your admin password in the script or environment variable")
-        print("Edit the PASSWORD variable in this script")
+        print("Set TEST_PASSWORD to the admin password before running")
         return
     
     # Run tests
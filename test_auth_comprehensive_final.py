@@ -8,25 +8,70 @@ import os
 import json
 import time
 import uuid
+import threading
+import urllib.parse
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any, Optional
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 BASE_URL = "https://jbms1.onrender.com"
+MAX_IN_FLIGHT = 8
 
 class AuthAPITester:
     """Comprehensive Authentication API Tester for Current Database Schema"""
     
+    # OAuth2PasswordRequestForm login bodies are URL-encoded forms
+    FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+    
     def __init__(self):
         self.base_url = BASE_URL
+        # One pooled session, so every test after the first reuses a warm TLS connection
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+        self.session.verify = False
+        # At most MAX_IN_FLIGHT requests reach the free Render instance at once, however the suites fan out
+        self._in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
         self.admin_token = None
         self.test_user_token = None
         self.test_results = []
-        
+        # Per-thread output/result buffers for test groups running concurrently
+        self._local = threading.local()
+        
+    def emit(self, line: str = ""):
+        """Print a line, or hold it back when the calling thread runs a buffered test group"""
+        lines = getattr(self._local, "lines", None)
+        if lines is None:
+            print(line)
+        else:
+            lines.append(line)
+    
+    def _run_buffered(self, group):
+        """Run a test group, returning its printed lines and logged results instead of emitting them"""
+        self._local.lines, self._local.results = [], []
+        try:
+            group()
+            return self._local.lines, self._local.results
+        finally:
+            self._local.lines = self._local.results = None
+    
+    def _req(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request on the pooled session, waiting for a free in-flight slot"""
+        with self._in_flight:
+            return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+    
+    def _fan_out(self, calls: list) -> list:
+        """Make independent requests concurrently; returns each response, or the exception it raised, in call order"""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+        return [future.exception() or future.result() for future in futures]
+    
     def log_test_result(self, test_name: str, endpoint: str, method: str, 
                        status_code: int, success: bool, details: str = ""):
         """Log test result"""
@@ -39,10 +84,11 @@ class AuthAPITester:
             "details": details,
             "timestamp": datetime.now().isoformat()
         }
-        self.test_results.append(result)
+        buffered = getattr(self._local, "results", None)
+        (self.test_results if buffered is None else buffered).append(result)
         
         status_icon = "✅" if success else "❌"
-        print(f"   {status_icon} {test_name}: {status_code} - {details}")
+        self.emit(f"   {status_icon} {test_name}: {status_code} - {details}")
         
     def test_health_check(self):
         """Test basic connectivity"""
@@ -51,7 +97,7 @@ class AuthAPITester:
         
         try:
             # Test root endpoint
-            response = requests.get(f"{self.base_url}/", timeout=30, verify=False)
+            response = self._req("GET", "/", timeout=30)
             self.log_test_result(
                 "Root Endpoint", "/", "GET", 
                 response.status_code, 
@@ -60,7 +106,7 @@ class AuthAPITester:
             )
             
             # Test health endpoint
-            response = requests.get(f"{self.base_url}/health", timeout=30, verify=False)
+            response = self._req("GET", "/health", timeout=30)
             self.log_test_result(
                 "Health Check", "/health", "GET",
                 response.status_code,
@@ -69,7 +115,7 @@ class AuthAPITester:
             )
             
             # Test version endpoint
-            response = requests.get(f"{self.base_url}/version", timeout=30, verify=False)
+            response = self._req("GET", "/version", timeout=30)
             if response.status_code == 200:
                 version_data = response.json()
                 details = f"v{version_data.get('version')} ({version_data.get('environment')})"
@@ -96,26 +142,23 @@ class AuthAPITester:
         print("\n2. 🔐 ADMIN AUTHENTICATION")
         print("=" * 60)
         
-        # Credentials to try (based on database schema and previous setup)
+        # Credentials to try (based on database schema and previous setup), each distinct pair once
+        test_password = os.getenv("TEST_PASSWORD", "change-me")
         credentials = [
-            ("admin", os.getenv("TEST_PASSWORD", "change-me")),  # Correct password
-            ("admin", os.getenv("TEST_PASSWORD", "change-me")),
-            ("admin", os.getenv("TEST_PASSWORD", "change-me")),
-            ("siva.data9@outlook.com", os.getenv("TEST_PASSWORD", "change-me")),
+            ("admin", test_password),  # Correct password
+            ("siva.data9@outlook.com", test_password),
             ("admin", "admin"),
         ]
         
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        
         for username, password in credentials:
             try:
-                login_data = f"username={username}&password = os.getenv("TEST_PASSWORD", "change-me")
-                response = requests.post(
-                    f"{self.base_url}/api/auth/login",
+                login_data = urllib.parse.urlencode({"username": username, "password": password})
+                response = self._req(
+                    "POST",
+                    "/api/auth/login",
                     data=login_data,
-                    headers=headers,
-                    timeout=30,
-                    verify=False
+                    headers=self.FORM_HEADERS,
+                    timeout=30
                 )
                 
                 if response.status_code == 200:
@@ -145,8 +188,8 @@ class AuthAPITester:
     
     def test_invalid_credentials(self):
         """Test login with invalid credentials"""
-        print("\n3. 🚫 INVALID CREDENTIALS TEST")
-        print("=" * 60)
+        self.emit("\n3. 🚫 INVALID CREDENTIALS TEST")
+        self.emit("=" * 60)
         
         invalid_credentials = [
             ("nonexistent", "wrongpassword"),
@@ -155,18 +198,23 @@ class AuthAPITester:
             ("admin", ""),
         ]
         
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        
+        # The attempts are independent, so they go out together
+        calls = []
         for username, password in invalid_credentials:
+            login_data = urllib.parse.urlencode({"username": username, "password": password})
+            calls.append(partial(
+                self._req,
+                "POST",
+                "/api/auth/login",
+                data=login_data,
+                headers=self.FORM_HEADERS,
+                timeout=30
+            ))
+        
+        for (username, password), response in zip(invalid_credentials, self._fan_out(calls)):
             try:
-                login_data = f"username={username}&password = os.getenv("TEST_PASSWORD", "change-me")
-                response = requests.post(
-                    f"{self.base_url}/api/auth/login",
-                    data=login_data,
-                    headers=headers,
-                    timeout=30,
-                    verify=False
-                )
+                if isinstance(response, Exception):
+                    raise response
                 
                 # Should return 401 for invalid credentials
                 expected_success = response.status_code == 401
@@ -186,8 +234,8 @@ class AuthAPITester:
     
     def test_protected_endpoints_without_auth(self):
         """Test protected endpoints without authentication"""
-        print("\n4. 🔒 PROTECTED ENDPOINTS (No Auth)")
-        print("=" * 60)
+        self.emit("\n4. 🔒 PROTECTED ENDPOINTS (No Auth)")
+        self.emit("=" * 60)
         
         protected_endpoints = [
             ("/api/auth/me", "GET"),
@@ -195,12 +243,15 @@ class AuthAPITester:
             ("/api/auth/register", "POST"),
         ]
         
-        for endpoint, method in protected_endpoints:
+        responses = self._fan_out([
+            partial(self._req, method, endpoint, timeout=30)
+            for endpoint, method in protected_endpoints
+        ])
+        
+        for (endpoint, method), response in zip(protected_endpoints, responses):
             try:
-                if method == "GET":
-                    response = requests.get(f"{self.base_url}{endpoint}", timeout=30, verify=False)
-                else:
-                    response = requests.post(f"{self.base_url}{endpoint}", timeout=30, verify=False)
+                if isinstance(response, Exception):
+                    raise response
                 
                 # Should return 401 or 422 (validation error) for missing auth
                 expected_success = response.status_code in [401, 422]
@@ -219,17 +270,17 @@ class AuthAPITester:
     def test_user_info_endpoints(self):
         """Test user information endpoints with admin token"""
         if not self.admin_token:
-            print("\n   ⚠️  Skipping user info tests - no admin token available")
+            self.emit("\n   ⚠️  Skipping user info tests - no admin token available")
             return
         
-        print("\n5. 👤 USER INFORMATION ENDPOINTS")
-        print("=" * 60)
+        self.emit("\n5. 👤 USER INFORMATION ENDPOINTS")
+        self.emit("=" * 60)
         
         headers = {"Authorization": f"Bearer {self.admin_token}"}
         
         # Test /api/auth/me
         try:
-            response = requests.get(f"{self.base_url}/api/auth/me", headers=headers, timeout=30, verify=False)
+            response = self._req("GET", "/api/auth/me", headers=headers, timeout=30)
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -261,7 +312,7 @@ class AuthAPITester:
         
         # Test /api/auth/users (admin/manager only)
         try:
-            response = requests.get(f"{self.base_url}/api/auth/users", headers=headers, timeout=30, verify=False)
+            response = self._req("GET", "/api/auth/users", headers=headers, timeout=30)
             
             if response.status_code == 200:
                 users_data = response.json()
@@ -302,11 +353,11 @@ class AuthAPITester:
     def test_user_registration(self):
         """Test user registration (admin only)"""
         if not self.admin_token:
-            print("\n   ⚠️  Skipping user registration tests - no admin token available")
+            self.emit("\n   ⚠️  Skipping user registration tests - no admin token available")
             return
         
-        print("\n6. 👥 USER REGISTRATION (Admin Only)")
-        print("=" * 60)
+        self.emit("\n6. 👥 USER REGISTRATION (Admin Only)")
+        self.emit("=" * 60)
         
         headers = {"Authorization": f"Bearer {self.admin_token}"}
         
@@ -322,12 +373,12 @@ class AuthAPITester:
         }
         
         try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/register",
+            response = self._req(
+                "POST",
+                "/api/auth/register",
                 json=user_data,
                 headers=headers,
-                timeout=30,
-                verify=False
+                timeout=30
             )
             
             if response.status_code == 200:
@@ -358,19 +409,18 @@ class AuthAPITester:
     
     def test_new_user_login(self, username: str, password: str):
         """Test login with newly created user"""
-        print(f"\n7. 🆕 NEW USER LOGIN TEST")
-        print("=" * 60)
+        self.emit(f"\n7. 🆕 NEW USER LOGIN TEST")
+        self.emit("=" * 60)
         
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        login_data = f"username={username}&password = os.getenv("TEST_PASSWORD", "change-me")
+        login_data = urllib.parse.urlencode({"username": username, "password": password})
         
         try:
-            response = requests.post(
-                f"{self.base_url}/api/auth/login",
+            response = self._req(
+                "POST",
+                "/api/auth/login",
                 data=login_data,
-                headers=headers,
-                timeout=30,
-                verify=False
+                headers=self.FORM_HEADERS,
+                timeout=30
             )
             
             if response.status_code == 200:
@@ -400,17 +450,17 @@ class AuthAPITester:
     def test_employee_permissions(self):
         """Test endpoints with employee token (limited permissions)"""
         if not self.test_user_token:
-            print("\n   ⚠️  Skipping employee permission tests - no employee token available")
+            self.emit("\n   ⚠️  Skipping employee permission tests - no employee token available")
             return
         
-        print("\n8. 👷 EMPLOYEE PERMISSION TESTS")
-        print("=" * 60)
+        self.emit("\n8. 👷 EMPLOYEE PERMISSION TESTS")
+        self.emit("=" * 60)
         
         headers = {"Authorization": f"Bearer {self.test_user_token}"}
         
         # Should work: /api/auth/me
         try:
-            response = requests.get(f"{self.base_url}/api/auth/me", headers=headers, timeout=30, verify=False)
+            response = self._req("GET", "/api/auth/me", headers=headers, timeout=30)
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -432,7 +482,7 @@ class AuthAPITester:
         
         # Should fail: /api/auth/users (admin/manager only)
         try:
-            response = requests.get(f"{self.base_url}/api/auth/users", headers=headers, timeout=30, verify=False)
+            response = self._req("GET", "/api/auth/users", headers=headers, timeout=30)
             
             if response.status_code == 403:
                 details = "Employee correctly denied access to user list"
@@ -465,12 +515,12 @@ class AuthAPITester:
                 "is_active": True
             }
             
-            response = requests.post(
-                f"{self.base_url}/api/auth/register",
+            response = self._req(
+                "POST",
+                "/api/auth/register",
                 json=unauthorized_user_data,
                 headers=headers,
-                timeout=30,
-                verify=False
+                timeout=30
             )
             
             if response.status_code == 403:
@@ -495,8 +545,8 @@ class AuthAPITester:
     
     def test_invalid_token(self):
         """Test with invalid/expired tokens"""
-        print("\n9. 🔐 INVALID TOKEN TESTS")
-        print("=" * 60)
+        self.emit("\n9. 🔐 INVALID TOKEN TESTS")
+        self.emit("=" * 60)
         
         invalid_tokens = [
             ("Bearer invalid_token_123", "Invalid Token"),
@@ -505,11 +555,15 @@ class AuthAPITester:
             ("Bearer " + "x" * 500, "Oversized Token"),
         ]
         
-        for auth_header, test_name in invalid_tokens:
-            headers = {"Authorization": auth_header}
-            
+        responses = self._fan_out([
+            partial(self._req, "GET", "/api/auth/me", headers={"Authorization": auth_header}, timeout=30)
+            for auth_header, _ in invalid_tokens
+        ])
+        
+        for (auth_header, test_name), response in zip(invalid_tokens, responses):
             try:
-                response = requests.get(f"{self.base_url}/api/auth/me", headers=headers, timeout=30, verify=False)
+                if isinstance(response, Exception):
+                    raise response
                 
                 # Should return 401 for invalid tokens
                 expected_success = response.status_code == 401
@@ -640,18 +694,33 @@ class AuthAPITester:
         
         start_time = time.time()
         
-        # Run all test suites
-        if not self.test_health_check():
-            print("❌ Health check failed - API might be down")
-            return self.generate_report()
-        
-        self.test_admin_login()
-        self.test_invalid_credentials()
-        self.test_protected_endpoints_without_auth()
-        self.test_user_info_endpoints()
-        self.test_user_registration()
-        self.test_invalid_token()
-        self.validate_database_schema_compliance()
+        try:
+            # Run all test suites
+            if not self.test_health_check():
+                print("❌ Health check failed - API might be down")
+                return self.generate_report()
+            
+            self.test_admin_login()
+            
+            # Everything else only needs the admin token (registration chains its own login),
+            # so the suites run together; each one's output is printed whole, in this order
+            suites = (
+                self.test_invalid_credentials,
+                self.test_protected_endpoints_without_auth,
+                self.test_user_info_endpoints,
+                self.test_user_registration,
+                self.test_invalid_token,
+            )
+            with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+                futures = [executor.submit(self._run_buffered, suite) for suite in suites]
+                for future in futures:
+                    lines, results = future.result()
+                    print("\n".join(lines))
+                    self.test_results.extend(results)
+            
+            self.validate_database_schema_compliance()
+        finally:
+            self.session.close()
         
         end_time = time.time()
         print(f"\n⏱️  Total testing time: {end_time - start_time:.2f} seconds")